@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import time
-from collections import OrderedDict
+from collections.abc import Hashable
 
 
 class DedupCache:
+    """TTL dedup cache with CLOCK (second-chance) eviction.
+
+    Hits only set a referenced bit instead of reordering entries. On insert the clock
+    hand sweeps the ring and reuses the first empty, expired or unreferenced slot.
+    """
+
     def __init__(self, *, ttl_sec: int, max_keys: int) -> None:
         if ttl_sec <= 0:
             raise ValueError("ttl_sec must be > 0")
@@ -12,30 +18,44 @@ class DedupCache:
             raise ValueError("max_keys must be > 0")
         self._ttl_sec = ttl_sec
         self._max_keys = max_keys
-        self._seen: OrderedDict[str, float] = OrderedDict()
-
-    def seen_recently(self, key: str) -> bool:
-        now = time.time()
-        self._prune(now)
-
-        ts = self._seen.get(key)
-        if ts is None:
-            self._seen[key] = now
-            self._enforce_max()
+        self._keys: list[Hashable | None] = [None] * max_keys
+        self._ts: list[float] = [0.0] * max_keys
+        self._ref = bytearray(max_keys)
+        self._slots: dict[Hashable, int] = {}
+        self._hand = 0
+
+    def seen_recently(self, key: Hashable) -> bool:
+        now = time.monotonic()
+
+        slot = self._slots.get(key)
+        if slot is None:
+            slot = self._evict(now)
+            self._keys[slot] = key
+            self._ts[slot] = now
+            self._ref[slot] = 0
+            self._slots[key] = slot
             return False
 
-        # Refresh recency.
-        self._seen.move_to_end(key)
-        return (now - ts) <= self._ttl_sec
-
-    def _enforce_max(self) -> None:
-        while len(self._seen) > self._max_keys:
-            self._seen.popitem(last=False)
+        self._ref[slot] = 1
+        if (now - self._ts[slot]) > self._ttl_sec:
+            # Expired but not evicted yet: treat as a fresh key.
+            self._ts[slot] = now
+            return False
+        return True
 
-    def _prune(self, now: float) -> None:
+    def _evict(self, now: float) -> int:
+        """Advance the hand to a reusable slot, freeing it, and return its index."""
         cutoff = now - self._ttl_sec
-        while self._seen:
-            _, ts = next(iter(self._seen.items()))
-            if ts > cutoff:
-                break
-            self._seen.popitem(last=False)
+        while True:
+            slot = self._hand
+            self._hand = (slot + 1) % self._max_keys
+            key = self._keys[slot]
+            if key is None:
+                return slot
+            if self._ref[slot] and self._ts[slot] > cutoff:
+                # Second chance.
+                self._ref[slot] = 0
+                continue
+            del self._slots[key]
+            self._keys[slot] = None
+            return slot
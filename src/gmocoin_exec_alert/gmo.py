@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
 from typing import Any
 
 import httpx
+import orjson
 
 
 class GmoCoinPrivateClient:
@@ -16,16 +16,25 @@ class GmoCoinPrivateClient:
         api_key: str,
         api_secret: str,
         base_url: str,
-        timeout_sec: int,
+        timeout_sec: int | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
+        """Pass a shared ``client`` or a ``timeout_sec`` (default 10s) for a private one, not both.
+
+        A shared client keeps its own timeout and is left open by ``aclose()``.
+        """
+        if client is not None and timeout_sec is not None:
+            raise ValueError("timeout_sec and client are mutually exclusive")
         self._api_key = api_key
-        self._api_secret = api_secret
+        # Keyed once; each signature copies this so the key pads are not re-derived.
+        self._hmac_template = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
         self._base_url = base_url.rstrip("/")
-        self._timeout = httpx.Timeout(timeout_sec)
-        self._client = httpx.AsyncClient(timeout=self._timeout)
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=httpx.Timeout(timeout_sec or 10))
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._owns_client:
+            await self._client.aclose()
 
     async def create_ws_token(self) -> str:
         # Spec: POST /private/v1/ws-auth with signed headers.
@@ -65,18 +74,16 @@ class GmoCoinPrivateClient:
         body: dict[str, Any] | None,
         include_body_in_sign: bool,
     ) -> Any:
-        timestamp = str(int(time.time() * 1000))
-        body_str = "" if body is None else json.dumps(body, separators=(",", ":"))
+        timestamp = str(time.time_ns() // 1_000_000)
+        body_bytes = b"" if body is None else orjson.dumps(body)
 
-        text = timestamp + method.upper() + path
+        text = (timestamp + method.upper() + path).encode("utf-8")
         if include_body_in_sign:
-            text += body_str
+            text += body_bytes
 
-        sign = hmac.new(
-            self._api_secret.encode("utf-8"),
-            text.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(text)
+        sign = mac.hexdigest()
 
         headers = {
             "API-KEY": self._api_key,
@@ -86,7 +93,7 @@ class GmoCoinPrivateClient:
         }
 
         url = f"{self._base_url}{path}"
-        resp = await self._client.request(method, url, headers=headers, content=body_str)
+        resp = await self._client.request(method, url, headers=headers, content=body_bytes)
         if resp.status_code // 100 != 2:
             raise RuntimeError(
                 f"GMO Coin API error: {method} {path} -> {resp.status_code} {resp.text}"
@@ -4,12 +4,16 @@ import asyncio
 import json
 import logging
 import signal
+from collections.abc import Container
+from operator import itemgetter
 from typing import Any
 
+import httpx
+import orjson
 import websockets
 from websockets.asyncio.client import ClientConnection
 
-from .config import load_config
+from .config import Config, load_config
 from .dedup import DedupCache
 from .gmo import GmoCoinPrivateClient
 from .pagerduty import PagerDutyClient
@@ -23,16 +27,39 @@ def _setup_logging(level: str) -> None:
     )
 
 
-def _dedup_key_for_event(event: dict[str, Any]) -> str:
+# Fields that identify an event per channel, in dedup key order.
+_KEY_FIELDS: dict[str, tuple[str, ...]] = {
+    "executionEvents": ("orderId", "executionId"),
+    "orderEvents": ("orderId", "orderStatus", "msgType", "orderTimestamp"),
+}
+_KEY_BUILDERS = {ch: itemgetter(*fields) for ch, fields in _KEY_FIELDS.items()}
+
+
+def _dedup_key_for_event(event: dict[str, Any]) -> tuple[Any, ...]:
+    # Tuples hash in C and skip building a string for every message; see _format_dedup_key.
     ch = str(event.get("channel", ""))
-    if ch == "executionEvents":
-        return f"gmocoin:{ch}:{event.get('orderId')}:{event.get('executionId')}"
-    if ch == "orderEvents":
-        return (
-            f"gmocoin:{ch}:{event.get('orderId')}:{event.get('orderStatus')}:"
-            f"{event.get('msgType')}:{event.get('orderTimestamp')}"
-        )
-    return f"gmocoin:{ch}:{hash(json.dumps(event, sort_keys=True, separators=(',', ':')))}"
+    builder = _KEY_BUILDERS.get(ch)
+    if builder is not None:
+        try:
+            return (ch, *builder(event))
+        except KeyError:
+            # Keep missing fields as None like the lookup-by-get keys always did.
+            return (ch, *(event.get(f) for f in _KEY_FIELDS[ch]))
+    try:
+        return (ch, hash(tuple(sorted(event.items()))))
+    except TypeError:
+        # Nested (unhashable) values: fall back to hashing a canonical JSON encoding.
+        return (ch, hash(json.dumps(event, sort_keys=True, separators=(",", ":"))))
+
+
+def _stringify_dedup_key(key: tuple[Any, ...]) -> tuple[str, ...]:
+    """Hashable form of a key whose fields held lists/dicts; formats the same as the original."""
+    return tuple(map(str, key))
+
+
+def _format_dedup_key(key: tuple[Any, ...]) -> str:
+    """Render a dedup key tuple as the PagerDuty dedup_key string."""
+    return "gmocoin:" + ":".join(map(str, key))
 
 
 def _summary_for_event(event: dict[str, Any]) -> str:
@@ -64,7 +91,8 @@ async def _extend_token_loop(
 ) -> None:
     while not stop.is_set():
         try:
-            await asyncio.wait_for(stop.wait(), timeout=every_sec)
+            async with asyncio.timeout(every_sec):
+                await stop.wait()
             return
         except TimeoutError:
             pass
@@ -80,50 +108,74 @@ async def _recv_loop(
     *,
     stop: asyncio.Event,
     ws: ClientConnection,
-    channels: set[str],
+    channels: Container[str],
     dedup: DedupCache,
     pd: PagerDutyClient,
     logger: logging.Logger,
 ) -> None:
+    # Bind hot-path callables to locals to skip global/attribute lookups per frame.
+    loads = orjson.loads
+    seen = dedup.seen_recently
+    enqueue = pd.enqueue_trigger
+    warn = logger.warning
+    info = logger.info
+    key_for = _dedup_key_for_event
+    summary_for = _summary_for_event
+    dry_run = pd.dry_run
+
     async for raw in ws:
         if stop.is_set():
             return
         try:
-            event = json.loads(raw)
+            event = loads(raw)
         except Exception:
-            logger.warning("non-json ws message: %r", raw)
+            warn("non-json ws message: %r", raw)
             continue
 
         if not isinstance(event, dict):
-            logger.warning("unexpected ws message type: %r", event)
+            warn("unexpected ws message type: %r", event)
             continue
 
         ch = event.get("channel")
         if ch not in channels:
             continue
 
-        key = _dedup_key_for_event(event)
-        if dedup.seen_recently(key):
+        key = key_for(event)
+        try:
+            hit = seen(key)
+        except TypeError:
+            # A key field held a list/dict; only then pay for the stringified key.
+            key = _stringify_dedup_key(key)
+            hit = seen(key)
+        if hit:
             continue
 
-        summary = _summary_for_event(event)
-        try:
-            await pd.trigger(dedup_key=key, summary=summary, custom_details=event)
-            logger.info("pagerduty triggered: %s", summary)
-        except Exception:
-            logger.exception("pagerduty trigger failed (continuing): %s", summary)
+        if dry_run:
+            # Nothing is posted, so skip the dedup_key string and queueing; still show the alert.
+            info("pagerduty dry-run: %s", summary_for(event))
+            continue
 
+        # Posted in the background so bursts of fills don't serialize on PagerDuty round trips.
+        enqueue(
+            dedup_key=_format_dedup_key(key),
+            summary=summary_for(event),
+            custom_details=event,
+        )
 
-async def _run_once(stop: asyncio.Event) -> None:
-    cfg = load_config()
-    _setup_logging(cfg.log_level)
+
+async def _run_once(stop: asyncio.Event, cfg: Config) -> None:
     logger = logging.getLogger("gmocoin-exec-alert")
 
+    # One connection pool for both GMO Coin and PagerDuty requests.
+    http = httpx.AsyncClient(
+        timeout=httpx.Timeout(cfg.http_timeout_sec),
+        limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=300),
+    )
     gmo = GmoCoinPrivateClient(
         api_key=cfg.gmocoin_api_key,
         api_secret=cfg.gmocoin_api_secret,
         base_url=cfg.gmocoin_private_api_base,
-        timeout_sec=cfg.http_timeout_sec,
+        client=http,
     )
     pd = PagerDutyClient(
         routing_key=cfg.pagerduty_routing_key,
@@ -131,9 +183,14 @@ async def _run_once(stop: asyncio.Event) -> None:
         source=cfg.pagerduty_source,
         severity=cfg.pagerduty_severity,
         dry_run=cfg.pagerduty_dry_run,
-        timeout_sec=cfg.http_timeout_sec,
+        client=http,
+        logger=logger,
     )
     dedup = DedupCache(ttl_sec=cfg.dedup_ttl_sec, max_keys=cfg.dedup_max_keys)
+    # A tuple `in` over a few channels beats hashing; only many channels warrant a set.
+    channels: Container[str] = (
+        cfg.alert_channels if len(cfg.alert_channels) <= 4 else frozenset(cfg.alert_channels)
+    )
 
     # Create process monitor if enabled
     process_monitor = None
@@ -154,7 +211,7 @@ async def _run_once(stop: asyncio.Event) -> None:
 
         async with websockets.connect(ws_url, ping_interval=None) as ws:
             for ch in cfg.alert_channels:
-                await ws.send(json.dumps({"command": "subscribe", "channel": ch}))
+                await ws.send(orjson.dumps({"command": "subscribe", "channel": ch}), text=True)
                 logger.info("subscribed: %s", ch)
 
             tasks = []
@@ -173,7 +230,7 @@ async def _run_once(stop: asyncio.Event) -> None:
                 _recv_loop(
                     stop=stop,
                     ws=ws,
-                    channels=set(cfg.alert_channels),
+                    channels=channels,
                     dedup=dedup,
                     pd=pd,
                     logger=logger,
@@ -203,6 +260,7 @@ async def _run_once(stop: asyncio.Event) -> None:
                 pass
         await pd.aclose()
         await gmo.aclose()
+        await http.aclose()
 
 
 async def _runner() -> int:
@@ -221,12 +279,13 @@ async def _runner() -> int:
     backoff = cfg.reconnect_backoff_base_sec
     while not stop.is_set():
         try:
-            await _run_once(stop)
+            await _run_once(stop, cfg)
             backoff = cfg.reconnect_backoff_base_sec
         except Exception:
             logger.exception("run failed; reconnecting in %ss", backoff)
             try:
-                await asyncio.wait_for(stop.wait(), timeout=backoff)
+                async with asyncio.timeout(backoff):
+                    await stop.wait()
             except TimeoutError:
                 pass
             backoff = min(backoff * 2, cfg.reconnect_backoff_max_sec)
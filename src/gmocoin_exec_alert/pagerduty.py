@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
 from typing import Any
 
 import httpx
+import orjson
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Events API v2 takes one event per request, so queued triggers are posted as soon as they are
+# dequeued, with at most this many requests in flight.
+_MAX_CONCURRENT_POSTS = 8
 
 
 class PagerDutyClient:
@@ -14,17 +24,60 @@ class PagerDutyClient:
         source: str,
         severity: str,
         dry_run: bool,
-        timeout_sec: int,
+        timeout_sec: int | None = None,
+        client: httpx.AsyncClient | None = None,
+        logger: logging.Logger | None = None,
     ) -> None:
+        """Either ``timeout_sec`` (own client, default 10s) or ``client`` may be given.
+
+        An injected client is owned by the caller: its timeout applies and ``aclose()``
+        leaves it open.
+        """
+        if client is not None and timeout_sec is not None:
+            raise ValueError("timeout_sec and client are mutually exclusive")
         self._routing_key = routing_key
         self._events_api_url = events_api_url
-        self._source = source
-        self._severity = severity
         self._dry_run = dry_run
-        self._client = httpx.AsyncClient(timeout=httpx.Timeout(timeout_sec))
+        # Static parts of every trigger request, merged with per-event fields in trigger().
+        self._base_payload = {"source": source, "severity": severity}
+        self._base_body = {"routing_key": routing_key, "event_action": "trigger"}
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=httpx.Timeout(timeout_sec or 10))
+        self._logger = logger or logging.getLogger(__name__)
+        self._queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+        self._post_slots = asyncio.Semaphore(_MAX_CONCURRENT_POSTS)
+        self._posts: set[asyncio.Task[None]] = set()
+
+    @property
+    def dry_run(self) -> bool:
+        return self._dry_run
 
     async def aclose(self) -> None:
-        await self._client.aclose()
+        if self._worker is not None:
+            # Flush queued triggers before shutting the worker down.
+            await self._queue.join()
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        if self._owns_client:
+            await self._client.aclose()
+
+    def enqueue_trigger(
+        self,
+        *,
+        dedup_key: str,
+        summary: str,
+        custom_details: dict[str, Any],
+    ) -> None:
+        """Queue a trigger to be posted in the background; failures are logged, not raised."""
+        if self._dry_run:
+            return
+
+        self._queue.put_nowait(self._trigger_body(dedup_key, summary, custom_details))
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._drain_queue())
 
     async def trigger(
         self,
@@ -40,12 +93,35 @@ class PagerDutyClient:
         if self._dry_run:
             return
 
+        body = self._trigger_body(
+            dedup_key,
+            summary,
+            custom_details,
+            component=component,
+            group=group,
+            class_=class_,
+            severity=severity,
+        )
+        await self._post_trigger(body)
+
+    def _trigger_body(
+        self,
+        dedup_key: str,
+        summary: str,
+        custom_details: dict[str, Any],
+        *,
+        component: str | None = None,
+        group: str | None = None,
+        class_: str | None = None,
+        severity: str | None = None,
+    ) -> dict[str, Any]:
         payload: dict[str, Any] = {
+            **self._base_payload,
             "summary": summary,
-            "source": self._source,
-            "severity": severity or self._severity,
             "custom_details": custom_details,
         }
+        if severity:
+            payload["severity"] = severity
         if component:
             payload["component"] = component
         if group:
@@ -53,19 +129,38 @@ class PagerDutyClient:
         if class_:
             payload["class"] = class_
 
-        body = {
-            "routing_key": self._routing_key,
-            "event_action": "trigger",
-            "dedup_key": dedup_key,
-            "payload": payload,
-        }
+        return {**self._base_body, "dedup_key": dedup_key, "payload": payload}
 
-        resp = await self._client.post(self._events_api_url, json=body)
+    async def _post_trigger(self, body: dict[str, Any]) -> None:
+        resp = await self._client.post(
+            self._events_api_url, content=orjson.dumps(body), headers=_JSON_HEADERS
+        )
         if resp.status_code != 202:
             raise RuntimeError(
-                f"PagerDuty error: {resp.status_code} {resp.text} (dedup_key={dedup_key})"
+                f"PagerDuty error: {resp.status_code} {resp.text} (dedup_key={body['dedup_key']})"
             )
 
+    async def _drain_queue(self) -> None:
+        while True:
+            body = await self._queue.get()
+            await self._post_slots.acquire()
+            task = asyncio.create_task(self._post_queued(body))
+            # Keep a reference so the task is not garbage-collected mid-flight.
+            self._posts.add(task)
+            task.add_done_callback(self._posts.discard)
+
+    async def _post_queued(self, body: dict[str, Any]) -> None:
+        summary = body["payload"]["summary"]
+        try:
+            await self._post_trigger(body)
+        except Exception:
+            self._logger.exception("pagerduty trigger failed (continuing): %s", summary)
+        else:
+            self._logger.info("pagerduty triggered: %s", summary)
+        finally:
+            self._post_slots.release()
+            self._queue.task_done()
+
     async def resolve(
         self,
         *,
@@ -81,7 +176,9 @@ class PagerDutyClient:
             "dedup_key": dedup_key,
         }
 
-        resp = await self._client.post(self._events_api_url, json=body)
+        resp = await self._client.post(
+            self._events_api_url, content=orjson.dumps(body), headers=_JSON_HEADERS
+        )
         if resp.status_code != 202:
             raise RuntimeError(
                 f"PagerDuty resolve error: {resp.status_code} {resp.text} (dedup_key={dedup_key})"
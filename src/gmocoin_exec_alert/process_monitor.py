@@ -2,20 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import re
 import subprocess
-from dataclasses import dataclass
+import sys
 from datetime import datetime
 from typing import Any
 
 from .pagerduty import PagerDutyClient
 
-
-@dataclass
-class ProcessInfo:
-    pid: int
-    command: str
-    start_time: str
+_REGEX_METACHARS = frozenset(".^$*+?{}[]\\|()")
 
 
 class ProcessMonitor:
@@ -30,7 +26,15 @@ class ProcessMonitor:
         severity: str = "info",
         logger: logging.Logger | None = None,
     ) -> None:
-        self._pattern = re.compile(pattern)
+        self._pattern = pattern
+        # Plain-text patterns (the common case) are matched as a bytes substring, which skips
+        # decoding every command line. Real regexes keep str semantics (Unicode classes, flags).
+        self._literal_bytes: bytes | None = None
+        self._regex: re.Pattern[str] | None = None
+        if _REGEX_METACHARS.isdisjoint(pattern):
+            self._literal_bytes = pattern.encode("utf-8")
+        else:
+            self._regex = re.compile(pattern)
         self._check_interval_sec = check_interval_sec
         self._idle_threshold_sec = idle_threshold_sec
         self._severity = severity
@@ -40,39 +44,18 @@ class ProcessMonitor:
         # Use a stable dedup_key so we can resolve the same incident
         self._dedup_key = "ml-job-monitoring"
 
-    def _find_matching_processes(self) -> list[ProcessInfo]:
-        """Find all processes matching the pattern using ps command."""
-        try:
-            # Use ps to find processes
-            result = subprocess.run(
-                ["ps", "aux"],
-                capture_output=True,
-                text=True,
-                check=True,
-            )
+    def _matches(self, cmdline: bytes) -> bool:
+        if self._literal_bytes is not None:
+            return self._literal_bytes in cmdline
+        assert self._regex is not None
+        return self._regex.search(cmdline.decode("utf-8", "replace")) is not None
 
-            processes = []
-            for line in result.stdout.splitlines():
-                if self._pattern.search(line):
-                    # Parse ps output
-                    parts = line.split(None, 10)
-                    if len(parts) >= 11:
-                        try:
-                            pid = int(parts[1])
-                            # Get process start time and command
-                            start_time = parts[8]  # START column
-                            command = parts[10]  # COMMAND column
-                            processes.append(
-                                ProcessInfo(
-                                    pid=pid,
-                                    command=command,
-                                    start_time=start_time,
-                                )
-                            )
-                        except ValueError:
-                            continue
-
-            return processes
+    def _find_matching_processes(self) -> list[str]:
+        """Find the command lines of all processes matching the pattern."""
+        try:
+            if sys.platform.startswith("linux"):
+                return self._scan_proc()
+            return self._scan_ps()
         except subprocess.CalledProcessError as e:
             self._logger.error("Failed to run ps command: %s", e)
             return []
@@ -80,6 +63,46 @@ class ProcessMonitor:
             self._logger.error("Error finding processes: %s", e)
             return []
 
+    def _scan_proc(self) -> list[str]:
+        """Find matching processes by reading /proc/<pid>/cmdline (Linux, no fork)."""
+        commands = []
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                        raw = f.read()
+                except OSError:
+                    # Process exited or is not readable.
+                    continue
+                if not raw:
+                    # Kernel threads have an empty cmdline.
+                    continue
+                cmdline = raw.rstrip(b"\x00").replace(b"\x00", b" ")
+                if self._matches(cmdline):
+                    commands.append(cmdline.decode("utf-8", "replace"))
+        return commands
+
+    def _scan_ps(self) -> list[str]:
+        """Find matching processes using the ps command (non-Linux fallback)."""
+        commands = []
+        # Stream ps output line by line instead of buffering it all.
+        with subprocess.Popen(["ps", "aux"], stdout=subprocess.PIPE, bufsize=64 * 1024) as proc:
+            assert proc.stdout is not None
+            for line in proc.stdout:
+                if not self._matches(line):
+                    continue
+                # Parse ps output
+                parts = line.rstrip(b"\n").decode("utf-8", "replace").split(None, 10)
+                # Skip the header and malformed lines; keep the COMMAND column.
+                if len(parts) >= 11 and parts[1].isdigit():
+                    commands.append(parts[10])
+
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+        return commands
+
     async def monitor_loop(
         self,
         *,
@@ -95,7 +118,7 @@ class ProcessMonitor:
         """
         self._logger.info(
             "Starting process monitor (pattern=%s, check_interval=%ds, idle_threshold=%ds)",
-            self._pattern.pattern,
+            self._pattern,
             self._check_interval_sec,
             self._idle_threshold_sec,
         )
@@ -103,13 +126,14 @@ class ProcessMonitor:
         while not stop.is_set():
             try:
                 # Wait for check interval
-                await asyncio.wait_for(stop.wait(), timeout=self._check_interval_sec)
+                async with asyncio.timeout(self._check_interval_sec):
+                    await stop.wait()
                 return
             except TimeoutError:
                 pass
 
-            # Find matching processes
-            processes = self._find_matching_processes()
+            # Find matching processes off the event loop so the WS recv loop is not blocked
+            processes = await asyncio.to_thread(self._find_matching_processes)
             now = datetime.now()
 
             if processes:
@@ -124,7 +148,7 @@ class ProcessMonitor:
                 self._logger.debug(
                     "Found %d matching process(es): %s",
                     len(processes),
-                    [p.command for p in processes],
+                    processes,
                 )
             else:
                 # No processes found
@@ -150,12 +174,12 @@ class ProcessMonitor:
     async def _send_completion_notification(self, pd: PagerDutyClient) -> None:
         """Send PagerDuty notification that ML job has completed."""
         summary = (
-            f"ML Job Completed: No '{self._pattern.pattern}' processes detected for "
+            f"ML Job Completed: No '{self._pattern}' processes detected for "
             f"{self._idle_threshold_sec} seconds"
         )
         custom_details: dict[str, Any] = {
             "event_type": "ml_job_completion",
-            "pattern": self._pattern.pattern,
+            "pattern": self._pattern,
             "idle_threshold_sec": self._idle_threshold_sec,
             "completion_time": datetime.now().isoformat(),
         }
@@ -0,0 +1,72 @@
+"""Tests for the CLOCK-based DedupCache."""
+
+import random
+
+import pytest
+
+from gmocoin_exec_alert import dedup
+from gmocoin_exec_alert.dedup import DedupCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    c = _Clock()
+    monkeypatch.setattr(dedup.time, "monotonic", c)
+    return c
+
+
+def _assert_consistent(cache: DedupCache) -> None:
+    resident = {key: slot for slot, key in enumerate(cache._keys) if key is not None}
+    assert resident == cache._slots
+    assert len(cache._slots) <= cache._max_keys
+
+
+def test_hit_within_ttl(clock):
+    """A key seen again inside the TTL is reported as seen."""
+    cache = DedupCache(ttl_sec=10, max_keys=4)
+    assert cache.seen_recently("a") is False
+    clock.now += 9
+    assert cache.seen_recently("a") is True
+
+
+def test_key_after_ttl_is_fresh(clock):
+    """A key seen again after the TTL counts as new and restarts its TTL."""
+    cache = DedupCache(ttl_sec=10, max_keys=4)
+    assert cache.seen_recently("a") is False
+    clock.now += 11
+    assert cache.seen_recently("a") is False
+    clock.now += 5
+    assert cache.seen_recently("a") is True
+
+
+def test_second_chance_eviction(clock):
+    """When full, a recently hit key survives and an unreferenced one is evicted."""
+    cache = DedupCache(ttl_sec=100, max_keys=3)
+    for key in ("a", "b", "c"):
+        assert cache.seen_recently(key) is False
+    assert cache.seen_recently("a") is True
+
+    assert cache.seen_recently("d") is False
+    assert "b" not in cache._slots
+    assert cache.seen_recently("a") is True
+    assert cache.seen_recently("c") is True
+    assert cache.seen_recently("d") is True
+    _assert_consistent(cache)
+
+
+def test_slots_and_keys_stay_consistent_under_churn(clock):
+    """Random inserts, hits and expiry never desync the slot index from the ring."""
+    rng = random.Random(1305)
+    cache = DedupCache(ttl_sec=5, max_keys=16)
+    for _ in range(5000):
+        clock.now += rng.random()
+        cache.seen_recently(rng.randrange(64))
+        _assert_consistent(cache)
@@ -0,0 +1,111 @@
+"""Tests for dedup keys and the WebSocket receive loop."""
+
+import asyncio
+import json
+import logging
+
+from gmocoin_exec_alert.dedup import DedupCache
+from gmocoin_exec_alert.main import (
+    _dedup_key_for_event,
+    _format_dedup_key,
+    _recv_loop,
+    _stringify_dedup_key,
+)
+
+
+class _FakeWs:
+    """Async iterator over pre-encoded WebSocket frames."""
+
+    def __init__(self, events):
+        self._frames = [json.dumps(e) for e in events]
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for frame in self._frames:
+            yield frame
+
+
+class _FakePd:
+    def __init__(self, *, dry_run: bool = False) -> None:
+        self.dry_run = dry_run
+        self.triggers = []
+
+    def enqueue_trigger(self, *, dedup_key, summary, custom_details):
+        self.triggers.append(dedup_key)
+
+
+def _run_recv_loop(events, pd):
+    asyncio.run(
+        _recv_loop(
+            stop=asyncio.Event(),
+            ws=_FakeWs(events),
+            channels=("executionEvents", "orderEvents"),
+            dedup=DedupCache(ttl_sec=300, max_keys=100),
+            pd=pd,
+            logger=logging.getLogger("test"),
+        )
+    )
+
+
+def test_pagerduty_dedup_key_format():
+    """PagerDuty dedup_key strings stay gmocoin:<channel>:<fields...>."""
+    execution = {"channel": "executionEvents", "orderId": 123, "executionId": 456}
+    order = {
+        "channel": "orderEvents",
+        "orderId": 123,
+        "orderStatus": "ORDERED",
+        "msgType": "NOR",
+        "orderTimestamp": "2024-01-01T00:00:00.000Z",
+    }
+    missing = {"channel": "orderEvents", "orderId": 123}
+    unhashable = {"channel": "executionEvents", "orderId": [1, 2], "executionId": {"a": 1}}
+
+    assert _format_dedup_key(_dedup_key_for_event(execution)) == "gmocoin:executionEvents:123:456"
+    assert (
+        _format_dedup_key(_dedup_key_for_event(order))
+        == "gmocoin:orderEvents:123:ORDERED:NOR:2024-01-01T00:00:00.000Z"
+    )
+    assert (
+        _format_dedup_key(_dedup_key_for_event(missing)) == "gmocoin:orderEvents:123:None:None:None"
+    )
+    expected = "gmocoin:executionEvents:[1, 2]:{'a': 1}"
+    assert _format_dedup_key(_dedup_key_for_event(unhashable)) == expected
+    assert _format_dedup_key(_stringify_dedup_key(_dedup_key_for_event(unhashable))) == expected
+
+
+def test_recv_loop_handles_unhashable_key_fields():
+    """A list/dict key field neither raises nor changes the dedup_key string."""
+    pd = _FakePd()
+    events = [
+        {"channel": "executionEvents", "orderId": [1, 2], "executionId": 9},
+        {"channel": "executionEvents", "orderId": [1, 2], "executionId": 9},
+        {"channel": "executionEvents", "orderId": {"a": 1}, "executionId": 9},
+    ]
+    _run_recv_loop(events, pd)
+    assert pd.triggers == [
+        "gmocoin:executionEvents:[1, 2]:9",
+        "gmocoin:executionEvents:{'a': 1}:9",
+    ]
+
+
+def test_recv_loop_dry_run_logs_new_events_only(caplog):
+    """Dry-run logs each new alert once and queues nothing for PagerDuty."""
+    pd = _FakePd(dry_run=True)
+    event = {
+        "channel": "executionEvents",
+        "symbol": "BTC",
+        "side": "BUY",
+        "orderId": 1,
+        "executionId": 2,
+        "executionPrice": "100",
+        "executionSize": "0.1",
+    }
+    with caplog.at_level(logging.INFO, logger="test"):
+        _run_recv_loop([event, event], pd)
+
+    assert pd.triggers == []
+    assert [r.getMessage() for r in caplog.records] == [
+        "pagerduty dry-run: GMO Coin execution BTC BUY orderId=1 executionId=2 price=100 size=0.1"
+    ]
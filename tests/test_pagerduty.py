@@ -0,0 +1,81 @@
+"""Tests for the PagerDutyClient background trigger queue."""
+
+import asyncio
+import json
+import logging
+
+import httpx
+
+from gmocoin_exec_alert.pagerduty import PagerDutyClient
+
+
+def _make_client(handler):
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    pd = PagerDutyClient(
+        routing_key="rk",
+        events_api_url="https://events.example.invalid/v2/enqueue",
+        source="test",
+        severity="critical",
+        dry_run=False,
+        client=http,
+    )
+    return http, pd
+
+
+def test_aclose_flushes_queued_triggers():
+    """Every enqueued trigger is posted before aclose() returns."""
+    posted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        posted.append(json.loads(request.content)["dedup_key"])
+        return httpx.Response(202)
+
+    async def run():
+        http, pd = _make_client(handler)
+        for i in range(20):
+            pd.enqueue_trigger(dedup_key=f"k{i}", summary=f"s{i}", custom_details={})
+        await pd.aclose()
+        await http.aclose()
+
+    asyncio.run(run())
+    assert sorted(posted) == sorted(f"k{i}" for i in range(20))
+
+
+def test_failed_trigger_is_logged_and_worker_continues(caplog):
+    """A non-202 response is logged and later triggers are still posted."""
+    posted = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        key = json.loads(request.content)["dedup_key"]
+        posted.append(key)
+        return httpx.Response(500 if key == "bad" else 202)
+
+    async def run():
+        http, pd = _make_client(handler)
+        pd.enqueue_trigger(dedup_key="bad", summary="bad event", custom_details={})
+        await asyncio.sleep(0.01)
+        pd.enqueue_trigger(dedup_key="good", summary="good event", custom_details={})
+        await pd.aclose()
+        await http.aclose()
+
+    with caplog.at_level(logging.INFO):
+        asyncio.run(run())
+
+    assert posted == ["bad", "good"]
+    messages = [r.getMessage() for r in caplog.records]
+    assert "pagerduty trigger failed (continuing): bad event" in messages
+    assert "pagerduty triggered: good event" in messages
+
+
+def test_aclose_leaves_shared_client_open():
+    """aclose() does not close an httpx client it was given."""
+
+    async def run():
+        http, pd = _make_client(lambda request: httpx.Response(202))
+        pd.enqueue_trigger(dedup_key="k", summary="s", custom_details={})
+        await pd.aclose()
+        closed = http.is_closed
+        await http.aclose()
+        return closed
+
+    assert asyncio.run(run()) is False
@@ -0,0 +1,43 @@
+"""Tests for ProcessMonitor command-line matching."""
+
+import re
+
+import pytest
+
+from gmocoin_exec_alert.process_monitor import _REGEX_METACHARS, ProcessMonitor
+
+
+def test_plain_text_pattern_uses_bytes_substring():
+    """Patterns without metacharacters match as a bytes substring, including non-ASCII text."""
+    monitor = ProcessMonitor(pattern="uv run atc")
+    assert monitor._literal_bytes == b"uv run atc"
+    assert monitor._matches(b"/usr/bin/uv run atc --epochs 3")
+    assert not monitor._matches(b"uv run other")
+
+    monitor = ProcessMonitor(pattern="学習 ジョブ")
+    assert monitor._literal_bytes is not None
+    assert monitor._matches("python 学習 ジョブ".encode())
+    assert not monitor._matches("python 学習".encode())
+
+
+def test_word_class_matches_non_ascii_cmdline():
+    r"""\w keeps its Unicode meaning rather than becoming ASCII-only."""
+    monitor = ProcessMonitor(pattern=r"train_\w+\.py")
+    assert monitor._matches("python train_日本語.py".encode())
+    assert monitor._matches("python train_ä.py".encode())
+
+
+def test_unicode_flag_pattern_compiles_and_matches():
+    """(?u) patterns are accepted and match non-ASCII digits."""
+    monitor = ProcessMonitor(pattern=r"(?u)job-\d+")
+    assert monitor._matches("runner job-٣".encode())
+    assert not monitor._matches(b"runner job-x")
+
+
+@pytest.mark.parametrize("char", sorted(_REGEX_METACHARS))
+def test_metacharacter_selects_regex_path(char):
+    """Any regex metacharacter routes the pattern through the str regex."""
+    monitor = ProcessMonitor(pattern=f"a{re.escape(char)}b")
+    assert monitor._literal_bytes is None
+    assert monitor._matches(f"cmd a{char}b".encode())
+    assert not monitor._matches(b"cmd ab")